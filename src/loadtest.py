@@ -0,0 +1,413 @@
+"""
+loadtest.py
+Load-test harness for Pet Care Tracker
+Author: Amar Hassan
+
+Builds a deterministic synthetic fleet of owners and pets, then replays an
+open-loop workload of task completions, care-event logging, new pets and
+all_due sweeps against a Tracker. Latency is measured from each operation's
+scheduled arrival time, so a slow build is not hidden by the driver waiting
+for it. Results report p50/p99/p999 latency and throughput per operation.
+
+Run locally to compare builds:
+
+    python loadtest.py --owners 500 --duration 10 --concurrency 8
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+
+from petcare import Owner, Dog, Cat, Bird, CareTask, Schedule, Tracker
+from task_ledger import TaskLedger
+
+# -------------------------------
+# FLEET PROFILE
+# -------------------------------
+
+SPECIES_MIX = {Dog: 0.5, Cat: 0.4, Bird: 0.1}
+
+BREEDS = {
+    Dog: ["Labrador", "Pomsky", "Beagle", "Husky", "Poodle"],
+    Cat: ["Tabby", "Siamese", "Persian", "Maine Coon"],
+    Bird: ["Parrot", "Canary", "Cockatiel"],
+}
+
+WEIGHT_RANGE_KG = {Dog: (4.0, 45.0), Cat: (2.5, 8.0), Bird: (0.05, 1.2)}
+
+# (task label, recurrence days, relative frequency)
+TASK_MIX = [
+    ("Breakfast", 1, 1.0),
+    ("Dinner", 1, 0.9),
+    ("Walk", 1, 0.5),
+    ("Grooming", 7, 0.4),
+    ("Litter", 2, 0.3),
+    ("Flea treatment", 30, 0.3),
+    ("Vet checkup", 365, 0.2),
+]
+
+OPERATIONS = ("complete", "log_event", "add_pet", "all_due")
+
+DEFAULT_RATES = {"complete": 200.0, "log_event": 100.0, "add_pet": 10.0, "all_due": 2.0}
+
+
+def _zipf_count(rng: random.Random, max_value: int, skew: float) -> int:
+    """Draw a value in 1..max_value with P(k) proportional to 1 / k**skew."""
+    values = range(1, max_value + 1)
+    return rng.choices(values, weights=[1 / k ** skew for k in values])[0]
+
+
+def _random_pet(rng: random.Random, name: str, start: date,
+                ledger: Optional[TaskLedger] = None):
+    species = rng.choices(list(SPECIES_MIX), weights=list(SPECIES_MIX.values()))[0]
+    low, high = WEIGHT_RANGE_KG[species]
+    pet = species(name, rng.choice(BREEDS[species]),
+                  round(rng.uniform(low, high), 2), round(rng.uniform(0.2, 15), 1))
+    for label, every_days, frequency in TASK_MIX:
+        if rng.random() < frequency:
+            offset = rng.randrange(every_days)
+            schedule = Schedule(every_days, start + timedelta(days=offset), ledger=ledger)
+            pet.add_task(CareTask(label, schedule))
+    return pet
+
+
+def fleet_capacity(owners: int, max_pets: int = 20) -> int:
+    """Most ledger records generate_fleet can need for a fleet of this size."""
+    return owners * max_pets * len(TASK_MIX)
+
+
+def generate_fleet(owners: int, seed: int = 0, max_pets: int = 20,
+                   skew: float = 1.5, start: Optional[date] = None,
+                   ledger: Optional[TaskLedger] = None) -> Tracker:
+    """Build a reproducible Tracker full of synthetic owners and pets.
+
+    Args:
+        owners (int): Number of owners to create.
+        seed (int): Random seed; the same seed always gives the same fleet.
+        max_pets (int): Largest number of pets a single owner can have.
+        skew (float): Zipf exponent for pets per owner (higher = more owners with one pet).
+        start (date): First due date for generated tasks.
+        ledger (TaskLedger): If given, every schedule is stored in this ledger.
+            See fleet_capacity for how many records it needs.
+
+    Returns:
+        Tracker: The populated tracker.
+    """
+    if owners <= 0:
+        raise ValueError("Fleet must have at least 1 owner.")
+    rng = random.Random(seed)
+    start = start or date(2025, 1, 1)
+
+    tracker = Tracker()
+    for i in range(owners):
+        owner = Owner(f"Owner {i}")
+        for j in range(_zipf_count(rng, max_pets, skew)):
+            owner.add_pet(_random_pet(rng, f"Pet {i}-{j}", start, ledger))
+        tracker.register_owner(owner)
+    return tracker
+
+
+# -------------------------------
+# RESULTS
+# -------------------------------
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, int(-(-pct * len(ordered) // 100)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class OperationStats:
+    """Latency samples (seconds) and throughput for one operation type.
+
+    Only successful calls count towards latency and throughput; failures are
+    counted separately by exception type.
+    """
+
+    def __init__(self, name: str, latencies: List[float], errors: Dict[str, int],
+                 elapsed: float):
+        self._name = name
+        self._latencies = latencies
+        self._errors = errors
+        self._elapsed = elapsed
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def count(self):
+        return len(self._latencies)
+
+    @property
+    def errors(self) -> Dict[str, int]:
+        """Failed calls keyed by exception type name."""
+        return dict(self._errors)
+
+    @property
+    def error_count(self) -> int:
+        return sum(self._errors.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.count / self._elapsed if self._elapsed > 0 else 0.0
+
+    def latency(self, pct: float) -> float:
+        return percentile(self._latencies, pct)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": dict(self._errors),
+            "throughput": round(self.throughput, 2),
+            "p50_ms": round(self.latency(50) * 1000, 3),
+            "p99_ms": round(self.latency(99) * 1000, 3),
+            "p999_ms": round(self.latency(99.9) * 1000, 3),
+        }
+
+    def __str__(self):
+        d = self.to_dict()
+        return (f"{self._name:<10} {d['count']:>8} {d['throughput']:>10.1f}/s "
+                f"p50 {d['p50_ms']:>8.3f}ms  p99 {d['p99_ms']:>8.3f}ms  "
+                f"p999 {d['p999_ms']:>8.3f}ms  errors {self.error_count}")
+
+
+class LoadTestResult:
+    """Per-operation statistics for one workload run."""
+
+    def __init__(self, stats: Dict[str, OperationStats], elapsed: float):
+        self._stats = stats
+        self._elapsed = elapsed
+
+    @property
+    def elapsed(self):
+        return self._elapsed
+
+    def __getitem__(self, operation: str) -> OperationStats:
+        return self._stats[operation]
+
+    def to_dict(self) -> dict:
+        return {"elapsed": round(self._elapsed, 3),
+                "operations": {name: s.to_dict() for name, s in self._stats.items()}}
+
+    def __str__(self):
+        lines = [f"Load test — {self._elapsed:.2f}s"]
+        lines.extend(str(s) for s in self._stats.values())
+        return "\n".join(lines)
+
+
+# -------------------------------
+# WORKLOAD DRIVER
+# -------------------------------
+
+class WorkloadDriver:
+    """Open-loop workload against a Tracker.
+
+    Arrivals follow a seeded Poisson process per operation, so the offered load
+    stays the same however slowly the Tracker responds. With burst > 1, each
+    arrival releases that many operations at once.
+
+    Every run() works on a fresh fleet, so repeated runs replay exactly the
+    same workload. Pass either a tracker, which is deep-copied for each run
+    and never changed, or a fleet_factory that builds a new tracker per run.
+    Trackers with ledger-backed schedules hold an mmap and cannot be copied,
+    so use a fleet_factory for those. Pets added during a run keep their
+    schedules in memory, not in the ledger.
+    """
+
+    def __init__(self, tracker: Optional[Tracker] = None,
+                 rates: Optional[Dict[str, float]] = None,
+                 concurrency: int = 4, burst: int = 1, seed: int = 0,
+                 log_file: Optional[str] = None, on: Optional[date] = None,
+                 fleet_factory: Optional[Callable[[], Tracker]] = None):
+        if (tracker is None) == (fleet_factory is None):
+            raise ValueError("Pass either a tracker or a fleet_factory.")
+        rates = dict(DEFAULT_RATES if rates is None else rates)
+        for name, rate in rates.items():
+            if name not in OPERATIONS:
+                raise ValueError(f"Unknown operation: {name}")
+            if rate < 0:
+                raise ValueError("Operation rates cannot be negative.")
+        if concurrency <= 0 or burst <= 0:
+            raise ValueError("Concurrency and burst must be at least 1.")
+
+        self._tracker = tracker
+        self._fleet_factory = fleet_factory
+        self._rates = {name: rate for name, rate in rates.items() if rate > 0}
+        self._concurrency = concurrency
+        self._burst = burst
+        self._seed = seed
+        self._log_file = log_file
+        self._on = on or date(2025, 1, 1)
+
+    def _plan(self, rng: random.Random, duration: float, fleet: Tracker, log_file: str):
+        """Pre-compute (arrival time, operation, callable) for the whole run."""
+        arrivals = []
+        for name, rate in self._rates.items():
+            t = rng.expovariate(rate / self._burst)
+            while t < duration:
+                arrivals.extend((t, name) for _ in range(self._burst))
+                t += rng.expovariate(rate / self._burst)
+        arrivals.sort(key=lambda item: item[0])
+
+        # Build calls in arrival order so pets added earlier in the run can be
+        # targeted by later completions and log events
+        state = {
+            "owners": list(fleet.owners),
+            "pets": [pet for owner in fleet.owners for pet in owner.pets],
+            "tasks": [task for owner in fleet.owners for pet in owner.pets for task in pet.tasks],
+            "new_pets": 0,
+        }
+        required = {
+            "complete": ("tasks", "Fleet has no tasks to complete."),
+            "log_event": ("pets", "Fleet has no pets to log events for."),
+            "add_pet": ("owners", "Fleet has no owners to add pets to."),
+        }
+        for name, (key, message) in required.items():
+            if name in self._rates and not state[key]:
+                raise ValueError(message)
+        return [(t, name, self._make_call(rng, name, fleet, state, log_file))
+                for t, name in arrivals]
+
+    def _make_call(self, rng: random.Random, name: str, fleet: Tracker,
+                   state: dict, log_file: str):
+        if name == "complete":
+            task = rng.choice(state["tasks"])
+            on = self._on + timedelta(days=rng.randrange(30))
+            return lambda: task.complete(on)
+        if name == "log_event":
+            pet = rng.choice(state["pets"])
+            return lambda: pet.log_event("Feeding", "load test", log_file)
+        if name == "add_pet":
+            owner = rng.choice(state["owners"])
+            state["new_pets"] += 1
+            pet = _random_pet(rng, f"Load pet {state['new_pets']}", self._on)
+            state["pets"].append(pet)
+            state["tasks"].extend(pet.tasks)
+            return lambda: owner.add_pet(pet)
+        return lambda: fleet.all_due(self._on)
+
+    def run(self, duration: float) -> LoadTestResult:
+        """Replay the workload for `duration` seconds and collect latencies."""
+        if duration <= 0:
+            raise ValueError("Duration must be positive.")
+
+        log_file = self._log_file
+        if log_file is None:
+            fd, log_file = tempfile.mkstemp(prefix="load_test_", suffix=".txt")
+            os.close(fd)
+        try:
+            return self._run(duration, log_file)
+        finally:
+            if self._log_file is None:
+                os.remove(log_file)
+
+    def _fresh_fleet(self) -> Tracker:
+        if self._fleet_factory is not None:
+            return self._fleet_factory()
+        try:
+            return copy.deepcopy(self._tracker)
+        except TypeError as exc:
+            raise ValueError(
+                "Tracker cannot be copied (ledger-backed schedules?); "
+                "pass a fleet_factory instead."
+            ) from exc
+
+    def _run(self, duration: float, log_file: str) -> LoadTestResult:
+        fleet = self._fresh_fleet()
+        plan = self._plan(random.Random(self._seed), duration, fleet, log_file)
+        latencies: Dict[str, List[float]] = {name: [] for name in self._rates}
+        errors: Dict[str, Dict[str, int]] = {name: {} for name in self._rates}
+        lock = threading.Lock()
+
+        def execute(scheduled: float, name: str, call):
+            try:
+                call()
+            except Exception as exc:
+                kind = type(exc).__name__
+                with lock:
+                    errors[name][kind] = errors[name].get(kind, 0) + 1
+                return
+            latency = time.perf_counter() - scheduled
+            with lock:
+                latencies[name].append(latency)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self._concurrency) as pool:
+            for offset, name, call in plan:
+                scheduled = started + offset
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(execute, scheduled, name, call)
+        elapsed = time.perf_counter() - started
+
+        stats = {name: OperationStats(name, latencies[name], errors[name], elapsed)
+                 for name in self._rates}
+        return LoadTestResult(stats, elapsed)
+
+
+# -------------------------------
+# COMMAND LINE
+# -------------------------------
+
+def main(argv: Optional[List[str]] = None) -> LoadTestResult:
+    parser = argparse.ArgumentParser(description="Replay a synthetic workload against Tracker.")
+    parser.add_argument("--owners", type=int, default=200)
+    parser.add_argument("--max-pets", type=int, default=20)
+    parser.add_argument("--skew", type=float, default=1.5)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    for name in OPERATIONS:
+        parser.add_argument(f"--{name.replace('_', '-')}-rate", type=float,
+                            default=DEFAULT_RATES[name], dest=f"{name}_rate")
+    parser.add_argument("--ledger", action="store_true",
+                        help="Store every schedule in a shared TaskLedger.")
+    parser.add_argument("--json", help="Also write results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    rates = {name: getattr(args, f"{name}_rate") for name in OPERATIONS}
+    options = dict(concurrency=args.concurrency, burst=args.burst, seed=args.seed)
+    fleet_options = dict(seed=args.seed, max_pets=args.max_pets, skew=args.skew)
+
+    if args.ledger:
+        with tempfile.TemporaryDirectory() as ledger_dir:
+            ledgers = []
+
+            def ledger_fleet():
+                path = os.path.join(ledger_dir, f"run-{len(ledgers)}.ledger")
+                ledgers.append(TaskLedger(path, fleet_capacity(args.owners, args.max_pets)))
+                return generate_fleet(args.owners, ledger=ledgers[-1], **fleet_options)
+
+            try:
+                driver = WorkloadDriver(rates=rates, fleet_factory=ledger_fleet, **options)
+                result = driver.run(args.duration)
+            finally:
+                for ledger in ledgers:
+                    ledger.close()
+    else:
+        tracker = generate_fleet(args.owners, **fleet_options)
+        result = WorkloadDriver(tracker, rates, **options).run(args.duration)
+
+    print(result)
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(result.to_dict(), file, indent=2)
+    return result
+
+
+if __name__ == "__main__":
+    main()
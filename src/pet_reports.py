@@ -0,0 +1,261 @@
+"""
+pet_reports.py
+Parallel per-owner report pipeline for Pet Care Tracker
+Author: Amar Hassan
+
+Renders one text report per owner (health summary, vet record counts, food
+portion and each task's next due date) into a sharded output directory.
+Reports are rendered on a thread or process pool, and owners whose data has
+not changed since the last run are skipped using content hashes stored in a
+manifest file.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from petcare import Owner, Tracker
+
+MANIFEST_NAME = "manifest.json"
+# Bump whenever render_owner_report changes, so old reports are re-rendered
+REPORT_FORMAT_VERSION = 1
+EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+ACTIVITY_LEVELS = ("low", "medium", "high")
+
+
+# -------------------------------
+# SNAPSHOT + RENDERING
+# -------------------------------
+
+def snapshot_owner(owner: Owner, activity_level: str = "medium") -> dict:
+    """Collect the data a report needs as plain, picklable values.
+
+    Args:
+        owner (Owner): The owner to report on.
+        activity_level (str): Activity level used for food portions.
+
+    Returns:
+        dict: Owner name plus one entry per pet.
+    """
+    pets = []
+    for pet in owner.pets:
+        pets.append({
+            "pet": str(pet),
+            "health": pet.health_summary(),
+            "vaccinations": len(pet.vet.vaccinations),
+            "vet_visits": len(pet.vet.appointments),
+            "food_portion": round(pet.food_portion(activity_level), 2),
+            "tasks": [[task.label, task.next_due().isoformat()] for task in pet.tasks],
+        })
+    return {"owner": owner.name, "activity_level": activity_level, "pets": pets}
+
+
+def snapshot_hash(snapshot: dict) -> str:
+    """Return a stable content hash for an owner snapshot and the report format."""
+    payload = {"format": REPORT_FORMAT_VERSION, "snapshot": snapshot}
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def render_owner_report(snapshot: dict) -> str:
+    """Format an owner snapshot as a text report."""
+    lines = [f"Owner: {snapshot['owner']}", f"Pets: {len(snapshot['pets'])}", ""]
+    for pet in snapshot["pets"]:
+        health = pet["health"]
+        lines.append(pet["pet"])
+        lines.append(f"  Age: {health['age']}, Weight: {health['weight']}, "
+                     f"Status: {health['health_status']}")
+        lines.append(f"  Vet record: {pet['vaccinations']} vaccinations, "
+                     f"{pet['vet_visits']} vet visits")
+        lines.append(f"  Food portion ({snapshot['activity_level']}): {pet['food_portion']} g/day")
+        for label, next_due in pet["tasks"]:
+            lines.append(f"  Task: {label} — next due {next_due}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def report_path(output_dir: str, owner_name: str) -> str:
+    """Return the sharded path for an owner's report.
+
+    Reports are spread over subdirectories named after the first two hex
+    digits of the owner name's hash, so no directory grows too large.
+    """
+    digest = hashlib.sha256(owner_name.encode("utf-8")).hexdigest()
+    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in owner_name)
+    return os.path.join(output_dir, digest[:2], f"{safe_name}-{digest[:8]}.txt")
+
+
+def _report_snapshot(job: Tuple[str, dict, Optional[str]]) -> Tuple[str, str, bool]:
+    """Hash one snapshot and write its report unless it is unchanged.
+
+    Args:
+        job (tuple): (output_dir, snapshot, hash from the last run or None).
+
+    Returns:
+        tuple: (owner name, new hash, True if the report was written).
+    """
+    output_dir, snapshot, previous_hash = job
+    content_hash = snapshot_hash(snapshot)
+    path = report_path(output_dir, snapshot["owner"])
+    if content_hash == previous_hash and os.path.exists(path):
+        return snapshot["owner"], content_hash, False
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(render_owner_report(snapshot))
+    return snapshot["owner"], content_hash, True
+
+
+def _report_owner(job: Tuple[str, Owner, str, Optional[str]]) -> Tuple[str, str, bool]:
+    """Snapshot one owner, then hash and write its report (thread workers)."""
+    output_dir, owner, activity_level, previous_hash = job
+    return _report_snapshot((output_dir, snapshot_owner(owner, activity_level), previous_hash))
+
+
+# -------------------------------
+# PIPELINE
+# -------------------------------
+
+class ReportRun:
+    """Outcome and throughput of one pipeline run."""
+
+    def __init__(self, written: List[str], skipped: List[str], elapsed: float):
+        self._written = written
+        self._skipped = skipped
+        self._elapsed = elapsed
+
+    @property
+    def written(self):
+        return self._written
+
+    @property
+    def skipped(self):
+        return self._skipped
+
+    @property
+    def elapsed(self):
+        return self._elapsed
+
+    @property
+    def throughput(self) -> float:
+        """Owners processed (written or skipped) per second."""
+        total = len(self._written) + len(self._skipped)
+        rate = total / self._elapsed if self._elapsed > 0 else 0.0
+        return round(rate, 2)
+
+    def __str__(self):
+        return (f"{len(self._written)} written, {len(self._skipped)} unchanged "
+                f"in {self._elapsed:.3f}s ({self.throughput} owners/s)")
+
+
+class ReportPipeline:
+    """Renders per-owner reports in parallel and skips unchanged owners.
+
+    The "thread" executor snapshots, hashes and renders each owner inside the
+    workers. The "process" executor snapshots every owner on the calling
+    thread first, because ledger-backed schedules cannot be pickled, and only
+    hashes and renders in the workers. Rendering is cheap compared with
+    snapshotting, so process mode gives no speedup over thread mode; use it
+    only to keep hashing and file writes off the calling process.
+    """
+
+    def __init__(self, output_dir: str, executor: str = "thread",
+                 max_workers: Optional[int] = None, activity_level: str = "medium"):
+        if executor not in EXECUTORS:
+            raise ValueError("Executor must be 'thread' or 'process'.")
+        if not isinstance(activity_level, str) or activity_level.lower() not in ACTIVITY_LEVELS:
+            raise ValueError("Activity level must be 'low', 'medium', or 'high'.")
+        self._output_dir = output_dir
+        self._executor = executor
+        self._max_workers = max_workers
+        self._activity_level = activity_level
+
+    @property
+    def output_dir(self):
+        return self._output_dir
+
+    def run(self, tracker: Tracker, force: bool = False) -> ReportRun:
+        """Write reports for every owner in the tracker.
+
+        With the "process" executor, snapshots are taken serially on the
+        calling thread before any work reaches the pool (see the class notes).
+
+        Args:
+            tracker (Tracker): Owners to report on.
+            force (bool): Re-render every owner even if unchanged.
+
+        Returns:
+            ReportRun: Written and skipped owners plus throughput.
+        """
+        started = time.perf_counter()
+        manifest = self._load_manifest()
+        previous = {} if force else manifest
+        owners = tracker.owners
+
+        with EXECUTORS[self._executor](max_workers=self._max_workers) as pool:
+            if self._executor == "thread":
+                # Threads share the owners, so snapshotting happens in the workers too
+                jobs = [(self._output_dir, owner, self._activity_level, previous.get(owner.name))
+                        for owner in owners]
+                results = list(pool.map(_report_owner, jobs))
+            else:
+                # Owners may hold ledger-backed schedules that cannot be pickled,
+                # so snapshot here and ship plain data to workers in batches
+                jobs = [(self._output_dir, snapshot_owner(owner, self._activity_level),
+                         previous.get(owner.name)) for owner in owners]
+                results = list(pool.map(_report_snapshot, jobs,
+                                        chunksize=self._chunksize(len(jobs))))
+
+        hashes = {name: content_hash for name, content_hash, _ in results}
+        written = [name for name, _, was_written in results if was_written]
+        skipped = [name for name, _, was_written in results if not was_written]
+
+        self._remove_stale_reports(manifest, hashes)
+        self._save_manifest(hashes)
+        return ReportRun(written, skipped, time.perf_counter() - started)
+
+    def _chunksize(self, jobs: int) -> int:
+        workers = self._max_workers or os.cpu_count() or 1
+        return max(1, jobs // (workers * 4))
+
+    # -------- MANIFEST ----------
+    def _manifest_path(self) -> str:
+        return os.path.join(self._output_dir, MANIFEST_NAME)
+
+    def _load_manifest(self) -> Dict[str, str]:
+        try:
+            with open(self._manifest_path()) as file:
+                manifest = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _remove_stale_reports(self, manifest: Dict[str, str], hashes: Dict[str, str]):
+        """Delete reports for owners that are no longer in the tracker."""
+        for name in manifest:
+            if name not in hashes:
+                path = report_path(self._output_dir, name)
+                if os.path.exists(path):
+                    os.remove(path)
+                shard = os.path.dirname(path)
+                if os.path.isdir(shard) and not os.listdir(shard):
+                    os.rmdir(shard)
+
+    def _save_manifest(self, hashes: Dict[str, str]):
+        # Write beside the manifest and swap it in, so a crash never leaves it half-written
+        os.makedirs(self._output_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self._output_dir, prefix=".manifest-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(hashes, file, indent=2, sort_keys=True)
+            os.replace(temp_path, self._manifest_path())
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def __str__(self):
+        return f"ReportPipeline → {self._output_dir} ({self._executor} pool)"
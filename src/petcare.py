@@ -16,6 +16,7 @@ from pet_utils import (
     log_care_event,
     generate_health_summary,
 )
+from task_ledger import TaskLedger
 
 # -------------------------------
 # VET RECORD
@@ -34,6 +35,10 @@ class VetRecord:
     def add_appointment(self, note: str):
         self._appointments.append(note)
 
+    @property
+    def vaccinations(self):
+        return self._vaccinations
+
     @property
     def appointments(self):
         return self._appointments
@@ -47,23 +52,53 @@ class VetRecord:
 # -------------------------------
 
 class Schedule:
-    """Handles recurrence for care tasks."""
+    """Handles recurrence for care tasks.
 
-    def __init__(self, every_days: int, start: date):
+    If a TaskLedger is given, the schedule's state lives in the shared ledger
+    instead of on this object, so every process sees the same completions.
+    """
+
+    def __init__(self, every_days: int, start: date, ledger: Optional[TaskLedger] = None):
         if every_days <= 0:
             raise ValueError("Recurrence must be at least 1 day.")
+        task_id = ledger.add(every_days, start) if ledger is not None else None
+        self._setup(every_days, start, ledger, task_id)
+
+    def _setup(self, every_days: int, start: date, ledger: Optional[TaskLedger],
+               task_id: Optional[int]):
         self._every_days = every_days
         self._start = start
         self._last_completed: Optional[date] = None
+        self._ledger = ledger
+        self._task_id = task_id
+
+    @classmethod
+    def from_ledger(cls, ledger: TaskLedger, task_id: int) -> "Schedule":
+        """Attach to a schedule another process already stored in the ledger."""
+        every_days, start, _ = ledger.read(task_id)
+        schedule = cls.__new__(cls)
+        schedule._setup(every_days, start, ledger, task_id)
+        return schedule
+
+    @property
+    def task_id(self) -> Optional[int]:
+        return self._task_id
 
     def mark_completed(self, on: date):
-        self._last_completed = on
+        if self._ledger is not None:
+            self._ledger.mark_completed(self._task_id, on)
+        else:
+            self._last_completed = on
 
     def next_due(self) -> date:
+        every_days, start, last_completed = self._every_days, self._start, self._last_completed
+        if self._ledger is not None:
+            # The ledger record is the single source of truth for shared schedules
+            every_days, start, last_completed = self._ledger.read(self._task_id)
         # A newly created task is due on its start date
-        if self._last_completed is None:
-            return self._start
-        return self._last_completed + timedelta(days=self._every_days)
+        if last_completed is None:
+            return start
+        return last_completed + timedelta(days=every_days)
 
     def is_due(self, on: date) -> bool:
         return on >= self.next_due()
@@ -161,10 +196,10 @@ class Pet(ABC):
     def reminder_message(self, task_label: str) -> str:
         return format_reminder_message(self._name, task_label)
 
-    def log_event(self, event_type: str, notes: str):
+    def log_event(self, event_type: str, notes: str, log_file: str = "care_log.txt"):
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        log_care_event(self._name, event_type, timestamp, notes)
+        log_care_event(self._name, event_type, timestamp, notes, log_file)
 
     def health_summary(self) -> dict:
         return generate_health_summary(
@@ -270,6 +305,10 @@ class Tracker:
     def __init__(self):
         self._owners: Dict[str, Owner] = {}
 
+    @property
+    def owners(self) -> Tuple[Owner, ...]:
+        return tuple(self._owners.values())
+
     def register_owner(self, owner: Owner):
         self._owners[owner.name] = owner
 
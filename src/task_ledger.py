@@ -0,0 +1,198 @@
+"""
+task_ledger.py
+Shared, memory-mapped task ledger for Pet Care Tracker
+Author: Amar Hassan
+
+Stores schedule state for care tasks as fixed-width records in a single
+memory-mapped file, so several worker processes can share one copy of every
+schedule. Each record holds:
+
+    task id | recurrence days | start ordinal | last-completed ordinal
+
+Each read or write locks only the record it touches, both across processes
+(a POSIX byte-range lock) and across threads (a per-record thread lock), so
+completing one task never blocks reads or writes of another. Locking is not
+free: every ledger-backed Schedule.next_due() or is_due() call makes two lockf
+system calls, so Tracker.all_due makes two per task. The thread lock is
+exclusive even for reads, so threads reading the same record take turns;
+readers in different processes share the file lock and do not.
+
+Cross-process locking needs fcntl, so TaskLedger only runs on POSIX systems.
+POSIX locks belong to the process, not the file object: two TaskLedger
+instances on the same path in one process do not exclude each other. Share a
+single instance between threads instead.
+"""
+
+import mmap
+import os
+import struct
+import threading
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+# -------------------------------
+# FILE LAYOUT
+# -------------------------------
+
+_MAGIC = b"PCTL"
+_HEADER = struct.Struct("<4sII")   # magic, capacity, next free task id
+_RECORD = struct.Struct("<iiii")   # task id, every days, start, last completed
+_NEVER = 0                         # date ordinals start at 1, so 0 means "never"
+
+
+class TaskLedger:
+    """Fixed-width schedule records in a memory-mapped file."""
+
+    def __init__(self, path: str, capacity: int = 1024):
+        if fcntl is None:
+            raise OSError("TaskLedger needs POSIX file locks (fcntl).")
+        if capacity <= 0:
+            raise ValueError("Ledger capacity must be at least 1 record.")
+        self._path = path
+        self._record_locks: Dict[int, threading.Lock] = {}
+        self._map = None
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._file = os.fdopen(fd, "r+b")
+        try:
+            self._lock_range(0, _HEADER.size, exclusive=True)
+            try:
+                self._capacity = self._open_map(fd, capacity)
+            finally:
+                self._unlock_range(0, _HEADER.size)
+        except BaseException:
+            self.close()
+            raise
+
+    def _open_map(self, fd: int, capacity: int) -> int:
+        """Map the file, creating the header for a new ledger; return capacity."""
+        file_size = os.fstat(fd).st_size
+        if file_size == 0:
+            size = _HEADER.size + capacity * _RECORD.size
+            self._file.truncate(size)
+            self._map = mmap.mmap(fd, size)
+            _HEADER.pack_into(self._map, 0, _MAGIC, capacity, 1)
+            return capacity
+
+        if file_size < _HEADER.size:
+            raise ValueError(f"{self._path} is not a task ledger.")
+        self._map = mmap.mmap(fd, 0)
+        magic, capacity, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self._path} is not a task ledger.")
+        if file_size < _HEADER.size + capacity * _RECORD.size:
+            raise ValueError(f"{self._path} is truncated: too small for {capacity} records.")
+        return capacity
+
+    # -------- PROPERTIES ----------
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def __len__(self):
+        with self._locked(0, _HEADER.size, exclusive=False):
+            _, _, next_id = _HEADER.unpack_from(self._map, 0)
+        return next_id - 1
+
+    # -------- RECORDS ----------
+    def add(self, every_days: int, start: date) -> int:
+        """Allocate a new record and return its task id."""
+        if every_days <= 0:
+            raise ValueError("Recurrence must be at least 1 day.")
+        with self._locked(0, _HEADER.size, exclusive=True):
+            magic, capacity, task_id = _HEADER.unpack_from(self._map, 0)
+            if task_id > capacity:
+                raise ValueError("Task ledger is full.")
+            _RECORD.pack_into(self._map, self._offset(task_id),
+                              task_id, every_days, start.toordinal(), _NEVER)
+            _HEADER.pack_into(self._map, 0, magic, capacity, task_id + 1)
+        return task_id
+
+    def read(self, task_id: int) -> Tuple[int, date, Optional[date]]:
+        """Return (every_days, start, last_completed) for a task."""
+        offset = self._offset(task_id)
+        with self._locked(offset, _RECORD.size, exclusive=False):
+            stored_id, every_days, start, last = _RECORD.unpack_from(self._map, offset)
+        if stored_id != task_id:
+            raise KeyError(f"No task with id {task_id} in ledger.")
+        last_completed = None if last == _NEVER else date.fromordinal(last)
+        return every_days, date.fromordinal(start), last_completed
+
+    def mark_completed(self, task_id: int, on: date):
+        offset = self._offset(task_id)
+        with self._locked(offset, _RECORD.size, exclusive=True):
+            stored_id, every_days, start, _ = _RECORD.unpack_from(self._map, offset)
+            if stored_id != task_id:
+                raise KeyError(f"No task with id {task_id} in ledger.")
+            _RECORD.pack_into(self._map, offset, stored_id, every_days, start, on.toordinal())
+
+    # -------- LIFECYCLE ----------
+    def close(self):
+        if self._map is not None and not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __str__(self):
+        return f"TaskLedger at {self._path} — {len(self)}/{self._capacity} task(s)"
+
+    # -------- LOCKING HELPERS ----------
+    def _offset(self, task_id: int) -> int:
+        if not isinstance(task_id, int) or not 1 <= task_id <= self._capacity:
+            raise KeyError(f"No task with id {task_id} in ledger.")
+        return _HEADER.size + (task_id - 1) * _RECORD.size
+
+    def _lock_range(self, offset: int, length: int, exclusive: bool):
+        mode = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        fcntl.lockf(self._file, mode, length, offset)
+
+    def _unlock_range(self, offset: int, length: int):
+        fcntl.lockf(self._file, fcntl.LOCK_UN, length, offset)
+
+    def _locked(self, offset: int, length: int, exclusive: bool):
+        thread_lock = self._record_locks.get(offset)
+        if thread_lock is None:
+            # setdefault is atomic, so two threads always get the same lock object
+            thread_lock = self._record_locks.setdefault(offset, threading.Lock())
+        return _RangeLock(self, thread_lock, offset, length, exclusive)
+
+
+class _RangeLock:
+    """Holds one region's thread lock plus its byte-range file lock."""
+
+    def __init__(self, ledger: TaskLedger, thread_lock: threading.Lock,
+                 offset: int, length: int, exclusive: bool):
+        self._ledger = ledger
+        self._thread_lock = thread_lock
+        self._offset = offset
+        self._length = length
+        self._exclusive = exclusive
+
+    def __enter__(self):
+        # fcntl locks are per process, so threads also need the local lock
+        self._thread_lock.acquire()
+        try:
+            self._ledger._lock_range(self._offset, self._length, self._exclusive)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def __exit__(self, *exc):
+        try:
+            self._ledger._unlock_range(self._offset, self._length)
+        finally:
+            self._thread_lock.release()
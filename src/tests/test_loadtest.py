@@ -0,0 +1,122 @@
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import glob
+import tempfile
+import unittest
+from unittest import mock
+
+from loadtest import WorkloadDriver, fleet_capacity, generate_fleet, percentile
+from petcare import Owner, Tracker
+from task_ledger import TaskLedger
+
+
+class TestFleetGenerator(unittest.TestCase):
+
+    def test_fleet_is_deterministic(self):
+        a = generate_fleet(30, seed=7)
+        b = generate_fleet(30, seed=7)
+        self.assertEqual(
+            [str(p) for o in a.owners for p in o.pets],
+            [str(p) for o in b.owners for p in o.pets],
+        )
+
+    def test_pets_per_owner_is_skewed(self):
+        tracker = generate_fleet(300, seed=1, max_pets=10)
+        counts = [len(o.pets) for o in tracker.owners]
+        self.assertEqual(len(counts), 300)
+        self.assertTrue(all(1 <= c <= 10 for c in counts))
+        # Zipf: single-pet owners are the most common group
+        self.assertEqual(max(set(counts), key=counts.count), 1)
+
+
+class TestWorkloadDriver(unittest.TestCase):
+
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_run_reports_every_operation(self):
+        tracker = generate_fleet(20, seed=3)
+        with tempfile.TemporaryDirectory() as tmp:
+            driver = WorkloadDriver(
+                tracker,
+                rates={"complete": 400, "log_event": 200, "add_pet": 100, "all_due": 50},
+                concurrency=2,
+                burst=2,
+                log_file=os.path.join(tmp, "care_log.txt"),
+            )
+            result = driver.run(0.3)
+
+        for name in ("complete", "log_event", "add_pet", "all_due"):
+            stats = result[name]
+            self.assertGreater(stats.count, 0)
+            self.assertEqual(stats.errors, {})
+            self.assertGreaterEqual(stats.latency(99.9), stats.latency(50))
+
+    def test_runs_replay_without_changing_fleet(self):
+        tracker = generate_fleet(10, seed=2)
+        pets_before = sum(len(o.pets) for o in tracker.owners)
+        driver = WorkloadDriver(tracker, rates={"complete": 300, "add_pet": 100})
+
+        first = driver.run(0.2)
+        second = driver.run(0.2)
+
+        self.assertEqual(sum(len(o.pets) for o in tracker.owners), pets_before)
+        for name in ("complete", "add_pet"):
+            self.assertEqual(first[name].count, second[name].count)
+
+    def test_failures_excluded_from_latency(self):
+        driver = WorkloadDriver(generate_fleet(5, seed=4), rates={"add_pet": 200})
+        with mock.patch.object(Owner, "add_pet", side_effect=ValueError("boom")):
+            stats = driver.run(0.2)["add_pet"]
+        self.assertEqual(stats.count, 0)
+        self.assertEqual(stats.throughput, 0.0)
+        self.assertGreater(stats.errors["ValueError"], 0)
+
+    def test_default_log_file_is_removed(self):
+        pattern = os.path.join(tempfile.gettempdir(), "load_test_*.txt")
+        before = set(glob.glob(pattern))
+        WorkloadDriver(generate_fleet(5), rates={"log_event": 200}).run(0.1)
+        self.assertEqual(set(glob.glob(pattern)), before)
+
+    def test_empty_fleet_errors(self):
+        owner_without_pets = Tracker()
+        owner_without_pets.register_owner(Owner("Amar"))
+        with self.assertRaises(ValueError):
+            WorkloadDriver(owner_without_pets, rates={"log_event": 10}).run(0.1)
+        with self.assertRaises(ValueError):
+            WorkloadDriver(Tracker(), rates={"add_pet": 10}).run(0.1)
+
+    def test_ledger_backed_fleet(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger = TaskLedger(os.path.join(tmp, "fleet.ledger"), fleet_capacity(10))
+            try:
+                tracker = generate_fleet(10, seed=5, ledger=ledger)
+                # An mmap-backed fleet cannot be deep-copied for each run
+                with self.assertRaises(ValueError):
+                    WorkloadDriver(tracker, rates={"complete": 100}).run(0.1)
+
+                driver = WorkloadDriver(rates={"complete": 300, "all_due": 50},
+                                        fleet_factory=lambda: tracker)
+                result = driver.run(0.2)
+            finally:
+                ledger.close()
+        self.assertGreater(result["complete"].count, 0)
+        self.assertEqual(result["complete"].errors, {})
+
+    def test_needs_tracker_or_factory(self):
+        with self.assertRaises(ValueError):
+            WorkloadDriver()
+        with self.assertRaises(ValueError):
+            WorkloadDriver(generate_fleet(1), fleet_factory=lambda: generate_fleet(1))
+
+    def test_unknown_operation(self):
+        with self.assertRaises(ValueError):
+            WorkloadDriver(generate_fleet(1), rates={"delete": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+from petcare import Owner, Dog, Cat, CareTask, Schedule, Tracker
+import pet_reports
+from pet_reports import ReportPipeline, ReportRun, render_owner_report, report_path, snapshot_owner
+
+
+def _build_tracker():
+    tracker = Tracker()
+
+    amar = Owner("Amar")
+    suki = Dog("Suki", "Pomsky", 13.6, 1.5)
+    suki.add_task(CareTask("Breakfast", Schedule(1, date(2025, 1, 1))))
+    suki.vet.add_vaccination("Rabies")
+    amar.add_pet(suki)
+    tracker.register_owner(amar)
+
+    lena = Owner("Lena")
+    lena.add_pet(Cat("Luna", "Tabby", 5, 3))
+    tracker.register_owner(lena)
+    return tracker
+
+
+class TestReportRendering(unittest.TestCase):
+
+    def test_report_includes_pet_details(self):
+        owner = _build_tracker().owners[0]
+        text = render_owner_report(snapshot_owner(owner))
+        self.assertIn("Owner: Amar", text)
+        self.assertIn("Suki the Pomsky (Dog)", text)
+        self.assertIn("1 vaccinations, 0 vet visits", text)
+        self.assertIn("Breakfast — next due 2025-01-01", text)
+
+    def test_report_path_is_sharded(self):
+        path = report_path("out", "Amar")
+        self.assertEqual(os.path.dirname(os.path.dirname(path)), "out")
+
+
+class TestReportPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.output_dir = self._dir.name
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_writes_one_report_per_owner(self):
+        run = ReportPipeline(self.output_dir).run(_build_tracker())
+        self.assertEqual(sorted(run.written), ["Amar", "Lena"])
+        for name in run.written:
+            self.assertTrue(os.path.exists(report_path(self.output_dir, name)))
+        self.assertGreater(run.throughput, 0)
+
+    def test_skips_unchanged_owners(self):
+        tracker = _build_tracker()
+        pipeline = ReportPipeline(self.output_dir)
+        pipeline.run(tracker)
+
+        tracker.owners[0].pets[0].tasks[0].complete(date(2025, 1, 2))
+        run = pipeline.run(tracker)
+
+        self.assertEqual(run.written, ["Amar"])
+        self.assertEqual(run.skipped, ["Lena"])
+
+    def test_force_rewrites_everything(self):
+        tracker = _build_tracker()
+        pipeline = ReportPipeline(self.output_dir)
+        pipeline.run(tracker)
+        run = pipeline.run(tracker, force=True)
+        self.assertEqual(len(run.written), 2)
+
+    def test_removes_reports_for_departed_owners(self):
+        pipeline = ReportPipeline(self.output_dir)
+        pipeline.run(_build_tracker())
+        stale = report_path(self.output_dir, "Lena")
+
+        tracker = Tracker()
+        tracker.register_owner(_build_tracker().owners[0])
+        pipeline.run(tracker)
+
+        self.assertFalse(os.path.exists(stale))
+        self.assertFalse(os.path.exists(os.path.dirname(stale)))
+        self.assertTrue(os.path.exists(report_path(self.output_dir, "Amar")))
+
+    def test_format_version_change_rewrites_reports(self):
+        tracker = _build_tracker()
+        pipeline = ReportPipeline(self.output_dir)
+        pipeline.run(tracker)
+        with mock.patch.object(pet_reports, "REPORT_FORMAT_VERSION", pet_reports.REPORT_FORMAT_VERSION + 1):
+            run = pipeline.run(tracker)
+        self.assertEqual(len(run.written), 2)
+
+    def test_manifest_that_is_not_an_object(self):
+        with open(os.path.join(self.output_dir, pet_reports.MANIFEST_NAME), "w") as file:
+            file.write("[1, 2, 3]")
+        run = ReportPipeline(self.output_dir).run(_build_tracker())
+        self.assertEqual(len(run.written), 2)
+
+    def test_failed_manifest_write_keeps_previous_manifest(self):
+        tracker = _build_tracker()
+        pipeline = ReportPipeline(self.output_dir)
+        pipeline.run(tracker)
+        manifest_path = os.path.join(self.output_dir, pet_reports.MANIFEST_NAME)
+        with open(manifest_path) as file:
+            before = file.read()
+
+        with mock.patch.object(pet_reports.json, "dump", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                pipeline.run(tracker, force=True)
+
+        with open(manifest_path) as file:
+            self.assertEqual(file.read(), before)
+        self.assertEqual([f for f in os.listdir(self.output_dir) if f.endswith(".tmp")], [])
+
+    def test_invalid_activity_level(self):
+        with self.assertRaises(ValueError):
+            ReportPipeline(self.output_dir, activity_level="extreme")
+
+    def test_zero_elapsed_throughput(self):
+        self.assertEqual(ReportRun(["Amar"], [], 0).throughput, 0.0)
+
+    def test_process_pool(self):
+        run = ReportPipeline(self.output_dir, executor="process", max_workers=2).run(_build_tracker())
+        self.assertEqual(len(run.written), 2)
+
+    def test_invalid_executor(self):
+        with self.assertRaises(ValueError):
+            ReportPipeline(self.output_dir, executor="gpu")
+
+
+if __name__ == "__main__":
+    unittest.main()
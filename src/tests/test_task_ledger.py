@@ -0,0 +1,150 @@
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import fcntl
+import multiprocessing
+import tempfile
+import time
+import unittest
+from datetime import date, timedelta
+
+from petcare import CareTask, Schedule
+import task_ledger
+from task_ledger import TaskLedger
+
+HOLD_SECONDS = 0.3
+
+
+def _complete_in_child(path, task_id, on):
+    with TaskLedger(path) as ledger:
+        CareTask("Walk", Schedule.from_ledger(ledger, task_id)).complete(on)
+
+
+def _hold_record_lock(path, task_id, locked):
+    """Hold one record's file lock, as a process in the middle of an update would."""
+    offset = task_ledger._HEADER.size + (task_id - 1) * task_ledger._RECORD.size
+    with open(path, "r+b") as file:
+        fcntl.lockf(file, fcntl.LOCK_EX, task_ledger._RECORD.size, offset)
+        locked.set()
+        time.sleep(HOLD_SECONDS)
+        fcntl.lockf(file, fcntl.LOCK_UN, task_ledger._RECORD.size, offset)
+
+
+class TestTaskLedger(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "tasks.ledger")
+        self.ledger = TaskLedger(self.path, capacity=4)
+
+    def tearDown(self):
+        self.ledger.close()
+        self._dir.cleanup()
+
+    def test_add_and_read_record(self):
+        start = date(2025, 1, 1)
+        task_id = self.ledger.add(3, start)
+        self.assertEqual(self.ledger.read(task_id), (3, start, None))
+        self.assertEqual(len(self.ledger), 1)
+
+    def test_ledger_full(self):
+        for _ in range(4):
+            self.ledger.add(1, date.today())
+        with self.assertRaises(ValueError):
+            self.ledger.add(1, date.today())
+
+    def test_unknown_task_id(self):
+        with self.assertRaises(KeyError):
+            self.ledger.read(1)
+        with self.assertRaises(KeyError):
+            self.ledger.read(99)
+
+    def test_reopen_sees_existing_records(self):
+        task_id = self.ledger.add(2, date(2025, 1, 1))
+        self.ledger.mark_completed(task_id, date(2025, 1, 5))
+        with TaskLedger(self.path) as other:
+            self.assertEqual(other.capacity, 4)
+            self.assertEqual(other.read(task_id)[2], date(2025, 1, 5))
+
+    def test_rejects_file_shorter_than_header(self):
+        bad = os.path.join(self._dir.name, "short.ledger")
+        with open(bad, "wb") as file:
+            file.write(b"PCT")
+        with self.assertRaises(ValueError):
+            TaskLedger(bad)
+
+    def test_rejects_header_without_record_space(self):
+        bad = os.path.join(self._dir.name, "truncated.ledger")
+        with open(self.path, "rb") as file:
+            header = file.read(task_ledger._HEADER.size)
+        with open(bad, "wb") as file:
+            file.write(header)
+        with self.assertRaises(ValueError):
+            TaskLedger(bad)
+
+    def test_rejects_bad_magic(self):
+        bad = os.path.join(self._dir.name, "other.bin")
+        with open(bad, "wb") as file:
+            file.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            TaskLedger(bad)
+
+    def test_processes_lock_per_record(self):
+        first = self.ledger.add(1, date.today())
+        second = self.ledger.add(1, date.today())
+        locked = multiprocessing.Event()
+        child = multiprocessing.Process(target=_hold_record_lock, args=(self.path, first, locked))
+        child.start()
+        try:
+            self.assertTrue(locked.wait(5))
+
+            # Another record stays writable while the child holds the first one
+            began = time.perf_counter()
+            self.ledger.mark_completed(second, date.today())
+            self.assertLess(time.perf_counter() - began, HOLD_SECONDS / 2)
+
+            # The held record waits until the child releases it
+            self.ledger.mark_completed(first, date.today())
+            self.assertGreaterEqual(time.perf_counter() - began, HOLD_SECONDS / 2)
+        finally:
+            child.join()
+        self.assertEqual(self.ledger.read(first)[2], date.today())
+
+    def test_attached_schedule_matches_original(self):
+        start = date(2025, 3, 1)
+        original = Schedule(5, start, ledger=self.ledger)
+        attached = Schedule.from_ledger(self.ledger, original.task_id)
+        self.assertEqual(str(attached), str(original))
+        self.assertEqual(attached.next_due(), start)
+
+    def test_attached_schedule_uses_ledger_record(self):
+        original = Schedule(30, date(2024, 6, 1), ledger=self.ledger)
+        attached = Schedule.from_ledger(self.ledger, original.task_id)
+        attached.mark_completed(date(2025, 1, 1))
+        self.assertEqual(original.next_due(), date(2025, 1, 31))
+        self.assertEqual(attached.next_due(), date(2025, 1, 31))
+
+    def test_schedule_backed_by_ledger(self):
+        today = date.today()
+        task = CareTask("Feed", Schedule(1, today, ledger=self.ledger))
+        self.assertTrue(task.is_due(today))
+        task.complete(today)
+        self.assertFalse(task.is_due(today))
+        self.assertTrue(task.is_due(today + timedelta(days=1)))
+
+    def test_completion_visible_across_processes(self):
+        today = date.today()
+        schedule = Schedule(2, today, ledger=self.ledger)
+
+        child = multiprocessing.Process(
+            target=_complete_in_child, args=(self.path, schedule.task_id, today)
+        )
+        child.start()
+        child.join()
+
+        self.assertEqual(child.exitcode, 0)
+        self.assertEqual(schedule.next_due(), today + timedelta(days=2))
+
+
+if __name__ == "__main__":
+    unittest.main()